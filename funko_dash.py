@@ -1,12 +1,60 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 import os
+import tempfile
+from funko_kernels import indexed_range_mask, first_kept, count_kept
 
-@st.cache_data
+# Source CSV columns used by the dashboard, mapped to user-friendly names
+# (release-date is reduced to its year while loading)
+COLUMN_NAMES = {
+    "console-name": "Funko Category",
+    "product-name": "Figure Name",
+    "new-price": "Avg. eBay Sell Price",
+    "sales-volume": "Sales Volume",
+    "release-date": "Release Year"
+}
+
+# Bytes of CSV parsed per streamed block while loading
+CSV_BLOCK_SIZE = 1 << 20
+
+# Rows per page of the "Show filtered data" table
+PAGE_SIZE = 50
+
+# Explicit Arrow types for the source columns; prices keep their "$" formatting
+# and dates are only sliced for the year, so both are read as plain strings
+COLUMN_TYPES = {
+    "console-name": pa.dictionary(pa.int32(), pa.string()),
+    "product-name": pa.string(),
+    "new-price": pa.string(),
+    "sales-volume": pa.int32(),
+    "release-date": pa.string()
+}
+
+# Prices and Market Capitalization are stored as float32, so tables show them
+# to the cent instead of with float32 noise such as 5200.799805
+MONEY_COLUMN_CONFIG = {
+    column: st.column_config.NumberColumn(format="%.2f")
+    for column in ("Avg. eBay Sell Price", "Market Capitalization")
+}
+
+@st.cache_resource(show_spinner=False)
 def load_data(file_path):
     """
     Load and process the Funko Pop CSV data.
     
+    The processed data is written next to the CSV as an uncompressed Feather
+    (Arrow IPC) file and memory-mapped on later loads until the CSV is
+    modified. An unreadable cache file falls back to parsing the CSV.
+    
+    The result is cached with st.cache_resource, so every rerun and session
+    shares the same DataFrame without pickling it. Callers must treat it as
+    read-only; filtering with a mask returns a copy and is safe.
+    
     Args:
         file_path (str): Path to the CSV file.
     
@@ -16,164 +64,409 @@ def load_data(file_path):
             - If an error occurs: (None, error message as string)
     """
     try:
-        # Read the CSV file
-        df = pd.read_csv(file_path)
+        # Reuse the processed Feather copy when it is at least as new as the CSV
+        # and this script (so processing changes invalidate it too)
+        feather_path = os.path.splitext(file_path)[0] + ".feather"
+        source_mtime = max(os.path.getmtime(file_path), os.path.getmtime(__file__))
+        if os.path.exists(feather_path) and os.path.getmtime(feather_path) >= source_mtime:
+            try:
+                return feather.read_table(feather_path, memory_map=True).to_pandas(), None
+            except (OSError, pa.ArrowException):
+                pass  # A corrupt or truncated cache is rebuilt from the CSV below
+        
+        # Stream only the columns the dashboard uses in fixed-size blocks and
+        # filter out items with Sales Volume <= 1 as each block arrives, so peak
+        # memory tracks the kept rows rather than the whole file
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            convert_options=pacsv.ConvertOptions(include_columns=list(COLUMN_NAMES), column_types=COLUMN_TYPES)
+        )
+        batches = [batch.filter(pc.greater(batch.column("sales-volume"), 1)) for batch in reader]
+        
+        # Blocks carry their own dictionaries; unify them so Funko Category
+        # becomes a single categorical
+        table = pa.Table.from_batches(batches, schema=reader.schema).unify_dictionaries()
         
-        # Rename columns to user-friendly names
-        df = df.rename(columns={
-            "console-name": "Funko Category",
-            "product-name": "Figure Name",
-            "new-price": "Avg. eBay Sell Price",
-            "sales-volume": "Sales Volume",
-            "release-date": "Release Date"
-        })
+        # Strip "$" and thousands separators from prices with Arrow string kernels
+        # and cast to float32; blank or malformed prices become missing values
+        price = pc.replace_substring(pc.replace_substring(table.column("new-price"), "$", ""), ",", "")
+        price = pc.if_else(pc.match_substring_regex(price, r"^-?\d*\.?\d+$"), price, pa.scalar(None, pa.string()))
+        table = table.set_column(table.schema.get_field_index("new-price"), "new-price", pc.cast(price, pa.float32()))
+        
+        # Only the year of the "YYYY-MM-DD" Release Date is used, so slice its
+        # first four characters in Arrow and replace the date with an int16
+        # Release Year instead of building datetimes
+        year = pc.utf8_slice_codeunits(table.column("release-date"), 0, 4)
+        year = pc.if_else(pc.match_substring_regex(year, r"^\d{4}$"), year, pa.scalar(None, pa.string()))
+        table = table.set_column(table.schema.get_field_index("release-date"), "release-date", pc.cast(year, pa.int16()))
+        
+        # Rename columns to user-friendly names; Release Year stays a nullable
+        # Int16 so rows without a release date keep an empty year
+        table = table.rename_columns([COLUMN_NAMES[name] for name in table.column_names])
+        df = table.to_pandas(types_mapper={pa.int16(): pd.Int16Dtype()}.get)
         
         # Verify renaming worked
         if "Avg. eBay Sell Price" not in df.columns:
             st.error("Column 'new-price' not found or renamed incorrectly. Available columns: " + str(df.columns.tolist()))
             return None, "Column renaming failed"
         
-        # Convert Release Date to datetime with "YYYY-MM-DD" format
-        df["Release Date"] = pd.to_datetime(df["Release Date"], format='%Y-%m-%d', errors='coerce')
-        df["Release Year"] = df["Release Date"].dt.year
-        
-        # Convert Avg. eBay Sell Price to numeric, handling potential formatting issues
-        df["Avg. eBay Sell Price"] = pd.to_numeric(df["Avg. eBay Sell Price"].replace('[\$,]', '', regex=True), errors='coerce')
+        # Convert Sales Volume to the smallest numeric type that fits
+        df["Sales Volume"] = pd.to_numeric(df["Sales Volume"], errors='coerce', downcast="integer")
         
-        # Convert Sales Volume to numeric
-        df["Sales Volume"] = pd.to_numeric(df["Sales Volume"], errors='coerce')
+        # Calculate Market Capitalization in float32 (tables format it to the cent),
+        # multiplying straight into the new column's buffer
+        market_cap = np.empty(len(df), dtype=np.float32)
+        np.multiply(df["Sales Volume"].to_numpy(), df["Avg. eBay Sell Price"].to_numpy(), out=market_cap)
+        df["Market Capitalization"] = market_cap
         
-        # Calculate Market Capitalization
-        df["Market Capitalization"] = df["Sales Volume"] * df["Avg. eBay Sell Price"]
+        # Store rows by descending Market Capitalization so the default Top 10 is a head().
+        # The other rankings therefore break ties by Market Capitalization, and the
+        # filtered data table lists rows in this order rather than CSV order
+        df = df.sort_values(by="Market Capitalization", ascending=False, kind="stable")
         
-        # Filter out items with Sales Volume <= 1
-        df = df[df["Sales Volume"] > 1]
+        # Persist the processed data as Feather so later cold starts skip CSV parsing.
+        # It is left uncompressed so the memory-mapped read needs no decompression,
+        # and written to a temporary file first so a failed write never leaves a
+        # truncated cache behind
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix=".feather.tmp", dir=os.path.dirname(feather_path) or ".")
+            os.close(fd)
+            try:
+                feather.write_feather(df, temp_path, compression="uncompressed")
+                os.replace(temp_path, feather_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except (OSError, pa.ArrowException):
+            pass  # The cache is optional; without it the CSV is simply re-parsed next time
         
         return df, None
     except Exception as e:
         return None, str(e)
 
-# Define the file path
-file_path = "funko_data.csv"
-
-# Check if the file exists and is not empty
-if not os.path.exists(file_path):
-    st.error(f"Error: {file_path} not found in the app directory.")
-elif os.path.getsize(file_path) == 0:
-    st.error(f"Error: {file_path} is empty.")
-else:
-    # Load and process the data
-    df, error = load_data(file_path)
-    if error:
-        st.error(f"Error loading or processing data: {error}")
-    elif df is None:
-        st.error("Data loading returned None. Check earlier errors.")
+@st.cache_resource
+def load_rankings(file_path):
+    """
+    Precompute the row order of each Top 10 ranking.
+    
+    Args:
+        file_path (str): Path to the CSV file passed to load_data.
+    
+    Returns:
+        dict: Maps each ranking column to an array of row positions sorted by
+            that column, highest first, with missing values last. Ties keep the
+            stored Market Capitalization order.
+    """
+    df, _ = load_data(file_path)
+    rankings = {
+        column: np.argsort(-df[column].to_numpy(dtype="float64", na_value=np.nan), kind="stable")
+        for column in ("Sales Volume", "Avg. eBay Sell Price")
+    }
+    # Rows are already stored by descending Market Capitalization
+    rankings["Market Capitalization"] = np.arange(len(df))
+    return rankings
+
+@st.cache_resource
+def load_filter_arrays(file_path):
+    """
+    Extract the three filter columns as plain numpy arrays once per dataset.
+    
+    Args:
+        file_path (str): Path to the CSV file passed to load_data.
+    
+    Returns:
+        tuple: Release Year, Avg. eBay Sell Price and Sales Volume arrays, in
+            slider order, with missing values stored as NaN.
+    """
+    df, _ = load_data(file_path)
+    return (
+        df["Release Year"].to_numpy(dtype="float32", na_value=np.nan),
+        df["Avg. eBay Sell Price"].to_numpy(),
+        df["Sales Volume"].to_numpy(),
+    )
+
+@st.cache_resource
+def load_filter_indexes(file_path):
+    """
+    Sort each filter column once so slider ranges can be found by binary search.
+    
+    Args:
+        file_path (str): Path to the CSV file passed to load_data.
+    
+    Returns:
+        tuple: (order, sorted values) pair for each array from
+            load_filter_arrays, sorted ascending with NaN last.
+    """
+    indexes = []
+    for values in load_filter_arrays(file_path):
+        order = np.argsort(values, kind="stable")
+        indexes.append((order, values[order]))
+    return tuple(indexes)
+
+@st.cache_data
+def load_bounds(file_path):
+    """
+    Compute the slider bounds once per dataset instead of on every rerun.
+    
+    Args:
+        file_path (str): Path to the CSV file passed to load_data.
+    
+    Returns:
+        dict: (min, max) tuples for "year", "price" and "volume", or None for
+            a column with no valid values.
+    """
+    df, _ = load_data(file_path)
+    
+    def column_range(column, cast):
+        low, high = df[column].min(), df[column].max()
+        if pd.isna(low):
+            return None
+        return cast(low), cast(high)
+    
+    bounds = {
+        "year": column_range("Release Year", int),
+        # Prices are stored as float32, so round them back to whole cents for the slider
+        "price": column_range("Avg. eBay Sell Price", lambda price: round(float(price), 2)),
+        "volume": column_range("Sales Volume", int),
+    }
+    return bounds
+
+def top_rows(df, order, keep, column, n=10):
+    """
+    Select the n highest-ranked rows that pass the current filters.
+    
+    Args:
+        df (DataFrame): Processed data from load_data.
+        order (ndarray): Row positions sorted by the ranking column, highest first.
+        keep (ndarray): Boolean filter mask aligned with the rows of df.
+        column (str): Ranking column to display next to the figure name and category.
+        n (int): Number of rows to return.
+    
+    Returns:
+        DataFrame: The top n rows, projected to the displayed columns.
+    """
+    rows = first_kept(order, keep, n)
+    return df.iloc[rows][["Figure Name", "Funko Category", column]]
+
+@st.cache_data(max_entries=32)
+def filter_mask(file_path, selected_years, selected_price, selected_volume):
+    """
+    Apply the slider ranges to the data.
+    
+    Results are cached per combination of ranges, so revisiting a selection
+    (e.g. dragging a slider back) skips the filtering entirely. Every panel
+    reads this one mask; the filtered frame itself is never materialized.
+    
+    Args:
+        file_path (str): Path to the CSV file passed to load_data.
+        selected_years (tuple): Inclusive (min, max) release year.
+        selected_price (tuple): Inclusive (min, max) Avg. eBay Sell Price.
+        selected_volume (tuple): Inclusive (min, max) Sales Volume.
+    
+    Returns:
+        ndarray: Boolean mask of the rows inside every range.
+    """
+    # Start from the most selective slider range
+    return indexed_range_mask(
+        load_filter_arrays(file_path),
+        load_filter_indexes(file_path),
+        (selected_years, selected_price, selected_volume)
+    )
+
+@st.cache_data(max_entries=32)
+def category_counts(file_path, selected_years, selected_price, selected_volume):
+    """
+    Count the filtered figures per Funko Category.
+    
+    Args:
+        file_path (str): Path to the CSV file passed to load_data.
+        selected_years (tuple): Inclusive (min, max) release year.
+        selected_price (tuple): Inclusive (min, max) Avg. eBay Sell Price.
+        selected_volume (tuple): Inclusive (min, max) Sales Volume.
+    
+    Returns:
+        Series: Figure count per category, highest first, without empty categories.
+    """
+    df, _ = load_data(file_path)
+    keep = filter_mask(file_path, selected_years, selected_price, selected_volume)
+    
+    # Count figures per category straight from the categorical codes
+    categories = df["Funko Category"].cat.categories
+    codes = df["Funko Category"].cat.codes.to_numpy()
+    counts = pd.Series(count_kept(codes, keep, len(categories)), index=categories.rename("Funko Category"), name="count")
+    return counts[counts > 0].sort_values(ascending=False, kind="stable")
+
+@st.cache_data(max_entries=32)
+def top_figures(file_path, column, selected_years, selected_price, selected_volume):
+    """
+    Build the Top 10 table for one ranking column.
+    
+    Args:
+        file_path (str): Path to the CSV file passed to load_data.
+        column (str): Ranking column ("Market Capitalization", "Sales Volume"
+            or "Avg. eBay Sell Price").
+        selected_years (tuple): Inclusive (min, max) release year.
+        selected_price (tuple): Inclusive (min, max) Avg. eBay Sell Price.
+        selected_volume (tuple): Inclusive (min, max) Sales Volume.
+    
+    Returns:
+        pyarrow.Table: The ten highest-ranked filtered figures, already in the
+            Arrow format st.dataframe sends to the browser.
+    """
+    df, _ = load_data(file_path)
+    keep = filter_mask(file_path, selected_years, selected_price, selected_volume)
+    
+    # Walk the precomputed order instead of sorting, then convert to Arrow once
+    # here so cached reruns skip st.dataframe's pandas-to-Arrow conversion
+    top = top_rows(df, load_rankings(file_path)[column], keep, column)
+    return pa.Table.from_pandas(top, preserve_index=False)
+
+def main():
+    """
+    Render the dashboard: validate the data file, load it, build the sidebar
+    filters and show the filtered panels.
+    """
+    # Define the file path
+    file_path = "funko_data.csv"
+
+    # Check if the file exists and is not empty with a single stat call
+    try:
+        file_size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        file_size = None
+
+    if file_size is None:
+        st.error(f"Error: {file_path} not found in the app directory.")
+    elif file_size == 0:
+        st.error(f"Error: {file_path} is empty.")
     else:
-        # Check for missing or invalid data
-        if df["Avg. eBay Sell Price"].isna().all():
-            st.error("All Avg. eBay Sell Price values are missing or non-numeric after processing.")
-        elif df["Avg. eBay Sell Price"].isna().any():
-            st.warning(f"Some rows ({df['Avg. eBay Sell Price'].isna().sum()}) have missing or non-numeric Avg. eBay Sell Price values.")
-        
-        if df["Sales Volume"].isna().all():
-            st.error("All Sales Volume values are missing or non-numeric after filtering.")
-        elif df["Sales Volume"].isna().any():
-            st.warning(f"Some rows ({df['Sales Volume'].isna().sum()}) have missing or non-numeric Sales Volume values.")
-        
-        if df["Release Date"].isna().any():
-            st.warning(f"Some rows ({df['Release Date'].isna().sum()}) have invalid or missing Release Dates, set to NaT.")
-        
-        # Proceed with the dashboard if there’s usable data
-        st.title("Funko Pop Figure Dashboard")
-        
-        # Sidebar filters
-        st.sidebar.header("Filters")
-        
-        # Filter for Release Year range
-        valid_years = df["Release Year"].dropna()
-        if valid_years.empty:
-            st.error("No valid release years found. Cannot set year filter.")
-        else:
-            min_year = int(valid_years.min())
-            max_year = int(valid_years.max())
-            selected_years = st.sidebar.slider(
-                "Select release year range",
-                min_year,
-                max_year,
-                (min_year, max_year),
-                help="Slide to select the range of release years."
-            )
-        
-        # Filter for Avg. eBay Sell Price range
-        valid_prices = df["Avg. eBay Sell Price"].dropna()
-        if valid_prices.empty:
-            st.error("No valid Avg. eBay Sell Price values found after processing.")
-        else:
-            min_price = float(valid_prices.min())
-            max_price = float(valid_prices.max())
-            selected_price = st.sidebar.slider(
-                "Select price range",
-                min_price,
-                max_price,
-                (min_price, max_price),
-                help="Slide to select the range of average eBay sell prices."
-            )
-        
-        # Filter for Sales Volume range
-        valid_volumes = df["Sales Volume"].dropna()
-        if valid_volumes.empty:
-            st.error("No valid Sales Volume values found after filtering.")
+        # Load and process the data
+        df, error = load_data(file_path)
+        if error:
+            st.error(f"Error loading or processing data: {error}")
+        elif df is None:
+            st.error("Data loading returned None. Check earlier errors.")
         else:
-            min_volume = int(valid_volumes.min())
-            max_volume = int(valid_volumes.max())
-            selected_volume = st.sidebar.slider(
-                "Select sales volume range",
-                min_volume,
-                max_volume,
-                (min_volume, max_volume),
-                help="Slide to select the range of sales volumes (minimum is 2 due to initial filter)."
-            )
-        
-        # Apply filters
-        filtered_df = df[
-            df["Release Year"].between(selected_years[0], selected_years[1], inclusive='both') &
-            df["Avg. eBay Sell Price"].between(selected_price[0], selected_price[1], inclusive='both') &
-            df["Sales Volume"].between(selected_volume[0], selected_volume[1], inclusive='both')
-        ]
-        
-        # Check if filtered data is empty
-        if filtered_df.empty:
-            st.info("No data matches the selected filters. Try adjusting the ranges.")
-        else:
-            # Display metrics and visualizations
-            st.subheader("Number of Figures by Funko Category")
-            category_counts = filtered_df["Funko Category"].value_counts()
-            st.bar_chart(category_counts, use_container_width=True)
+            # Check for missing or invalid data, counting every column in one pass
+            na_counts = df[["Avg. eBay Sell Price", "Sales Volume", "Release Year"]].isna().sum()
+            row_count = len(df)
+            
+            if na_counts["Avg. eBay Sell Price"] == row_count:
+                st.error("All Avg. eBay Sell Price values are missing or non-numeric after processing.")
+            elif na_counts["Avg. eBay Sell Price"]:
+                st.warning(f"Some rows ({na_counts['Avg. eBay Sell Price']}) have missing or non-numeric Avg. eBay Sell Price values.")
+            
+            if na_counts["Sales Volume"] == row_count:
+                st.error("All Sales Volume values are missing or non-numeric after filtering.")
+            elif na_counts["Sales Volume"]:
+                st.warning(f"Some rows ({na_counts['Sales Volume']}) have missing or non-numeric Sales Volume values.")
+            
+            if na_counts["Release Year"]:
+                st.warning(f"Some rows ({na_counts['Release Year']}) have invalid or missing Release Dates, so their Release Year is empty.")
             
-            st.subheader("Top 10 Figures by Market Capitalization")
-            top_market_cap = filtered_df.sort_values(by="Market Capitalization", ascending=False).head(10)
-            st.dataframe(
-                top_market_cap[["Figure Name", "Funko Category", "Market Capitalization"]],
-                use_container_width=True
-            )
+            # Proceed with the dashboard if there’s usable data
+            st.title("Funko Pop Figure Dashboard")
             
-            st.subheader("Top 10 Figures by Sales Volume")
-            top_sales_volume = filtered_df.sort_values(by="Sales Volume", ascending=False).head(10)
-            st.dataframe(
-                top_sales_volume[["Figure Name", "Funko Category", "Sales Volume"]],
-                use_container_width=True
-            )
+            # Sidebar filters, grouped in a form so the data is only re-filtered
+            # when "Apply filters" is pressed rather than on every slider drag
+            st.sidebar.header("Filters")
+            filters = st.sidebar.form("filters")
             
-            st.subheader("Top 10 Figures by Avg. eBay Sell Price")
-            top_price = filtered_df.sort_values(by="Avg. eBay Sell Price", ascending=False).head(10)
-            st.dataframe(
-                top_price[["Figure Name", "Funko Category", "Avg. eBay Sell Price"]],
-                use_container_width=True
-            )
+            # Slider bounds are computed once per dataset
+            bounds = load_bounds(file_path)
             
-            # Optional: Show the filtered data table
-            if st.checkbox("Show filtered data", help="Check to display the filtered dataset."):
-                st.subheader("Filtered Data")
-                relevant_columns = ["Figure Name", "Funko Category", "Avg. eBay Sell Price", 
-                                   "Sales Volume", "Release Year", "Market Capitalization"]
-                st.dataframe(filtered_df[relevant_columns], use_container_width=True)
\ No newline at end of file
+            # Filter for Release Year range
+            if bounds["year"] is None:
+                st.error("No valid release years found. Cannot set year filter.")
+            else:
+                min_year, max_year = bounds["year"]
+                selected_years = filters.slider(
+                    "Select release year range",
+                    min_year,
+                    max_year,
+                    (min_year, max_year),
+                    help="Slide to select the range of release years."
+                )
+            
+            # Filter for Avg. eBay Sell Price range
+            if bounds["price"] is None:
+                st.error("No valid Avg. eBay Sell Price values found after processing.")
+            else:
+                min_price, max_price = bounds["price"]
+                selected_price = filters.slider(
+                    "Select price range",
+                    min_price,
+                    max_price,
+                    (min_price, max_price),
+                    help="Slide to select the range of average eBay sell prices."
+                )
+            
+            # Filter for Sales Volume range
+            if bounds["volume"] is None:
+                st.error("No valid Sales Volume values found after filtering.")
+            else:
+                min_volume, max_volume = bounds["volume"]
+                selected_volume = filters.slider(
+                    "Select sales volume range",
+                    min_volume,
+                    max_volume,
+                    (min_volume, max_volume),
+                    help="Slide to select the range of sales volumes (minimum is 2 due to initial filter)."
+                )
+            
+            filters.form_submit_button("Apply filters")
+            
+            # Apply filters (cached per slider combination)
+            selection = (selected_years, selected_price, selected_volume)
+            keep = filter_mask(file_path, *selection)
+            
+            # Check if filtered data is empty
+            if not keep.any():
+                st.info("No data matches the selected filters. Try adjusting the ranges.")
+            else:
+                # Display metrics and visualizations
+                st.subheader("Number of Figures by Funko Category")
+                st.bar_chart(category_counts(file_path, *selection), use_container_width=True)
+                
+                # Only the selected tab's Top 10 is computed; switching tabs reruns the script.
+                # Streamlit releases without lazy tabs reject on_change, so they fall back
+                # to plain tabs that render every table
+                st.subheader("Top 10 Figures")
+                ranking_columns = ["Market Capitalization", "Sales Volume", "Avg. eBay Sell Price"]
+                tab_labels = [f"By {column}" for column in ranking_columns]
+                try:
+                    ranking_tabs = st.tabs(tab_labels, key="ranking_tab", on_change="rerun")
+                except TypeError:
+                    ranking_tabs = st.tabs(tab_labels)
+                for tab, column in zip(ranking_tabs, ranking_columns):
+                    if getattr(tab, "open", True):
+                        with tab:
+                            st.dataframe(
+                                top_figures(file_path, column, *selection),
+                                column_config=MONEY_COLUMN_CONFIG,
+                                use_container_width=True
+                            )
+                
+                # Optional: Show the filtered data table
+                if st.checkbox("Show filtered data", help="Check to display the filtered dataset."):
+                    st.subheader("Filtered Data")
+                    relevant_columns = ["Figure Name", "Funko Category", "Avg. eBay Sell Price", 
+                                       "Sales Volume", "Release Year", "Market Capitalization"]
+                    # Send only the current page to the browser instead of every filtered row
+                    rows = np.flatnonzero(keep)
+                    page_count = -(-len(rows) // PAGE_SIZE)
+                    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                                           help=f"Browse the filtered data {PAGE_SIZE} rows at a time.")
+                    start = (page - 1) * PAGE_SIZE
+                    page_rows = rows[start:start + PAGE_SIZE]
+                    st.caption(f"Rows {start + 1}–{start + len(page_rows)} of {len(rows)}")
+                    st.dataframe(
+                        df.iloc[page_rows][relevant_columns],
+                        column_config=MONEY_COLUMN_CONFIG,
+                        hide_index=True,
+                        use_container_width=True
+                    )
+
+if __name__ == "__main__":
+    main()
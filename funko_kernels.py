@@ -0,0 +1,161 @@
+"""
+Numeric kernels for the dashboard's filter and Top 10 hot paths.
+
+The kernels are JIT-compiled with Numba when it is installed and fall back to
+equivalent vectorized numpy code otherwise. They live in their own module
+because Streamlit re-executes the dashboard script on every rerun, while an
+imported module is compiled (or loaded from Numba's on-disk cache) only once.
+"""
+import numpy as np
+
+# Above this fraction of candidate rows a full fused pass beats index lookups
+DENSE_FRACTION = 0.25
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Numba is optional; the numpy fallbacks below are used instead
+
+if njit is not None:
+    @njit(cache=True)
+    def _range_mask(years, prices, volumes, y0, y1, p0, p1, v0, v1):
+        keep = np.empty(years.size, dtype=np.bool_)
+        for i in range(years.size):
+            keep[i] = (y0 <= years[i] <= y1) and (p0 <= prices[i] <= p1) and (v0 <= volumes[i] <= v1)
+        return keep
+
+    @njit(cache=True)
+    def _first_kept(order, keep, n):
+        rows = np.empty(n, dtype=np.int64)
+        found = 0
+        for row in order:
+            if found == n:
+                break
+            if keep[row]:
+                rows[found] = row
+                found += 1
+        return rows[:found]
+
+    @njit(cache=True)
+    def _count_kept(codes, keep, n_categories):
+        counts = np.zeros(n_categories, dtype=np.int64)
+        for i in range(codes.size):
+            if keep[i] and codes[i] >= 0:
+                counts[codes[i]] += 1
+        return counts
+else:
+    def _range_mask(years, prices, volumes, y0, y1, p0, p1, v0, v1):
+        # Every comparison writes into one scratch buffer that is AND-ed into
+        # the result in place, so no per-filter boolean arrays are allocated
+        keep = np.ones(years.size, dtype=bool)
+        scratch = np.empty_like(keep)
+        for values, low, high in ((years, y0, y1), (prices, p0, p1), (volumes, v0, v1)):
+            np.greater_equal(values, low, out=scratch)
+            keep &= scratch
+            np.less_equal(values, high, out=scratch)
+            keep &= scratch
+        return keep
+
+    def _first_kept(order, keep, n):
+        return order[keep[order]][:n]
+
+    def _count_kept(codes, keep, n_categories):
+        kept = codes[keep]
+        return np.bincount(kept[kept >= 0], minlength=n_categories)
+
+def _as_column_type(values, bound):
+    """Cast a float bound to the column's float type so both paths compare alike."""
+    return values.dtype.type(bound) if values.dtype.kind == "f" else bound
+
+def range_mask(years, prices, volumes, selected_years, selected_price, selected_volume):
+    """
+    Build the combined inclusive range filter in a single pass.
+
+    Args:
+        years (ndarray): Release Year per row, NaN where missing.
+        prices (ndarray): Avg. eBay Sell Price per row, NaN where missing.
+        volumes (ndarray): Sales Volume per row.
+        selected_years (tuple): Inclusive (min, max) release year.
+        selected_price (tuple): Inclusive (min, max) Avg. eBay Sell Price.
+        selected_volume (tuple): Inclusive (min, max) Sales Volume.
+
+    Returns:
+        ndarray: Boolean mask of the rows inside every range. NaN values never
+            satisfy a range.
+    """
+    y0, y1 = (_as_column_type(years, bound) for bound in selected_years)
+    p0, p1 = (_as_column_type(prices, bound) for bound in selected_price)
+    v0, v1 = (_as_column_type(volumes, bound) for bound in selected_volume)
+    return _range_mask(years, prices, volumes, y0, y1, p0, p1, v0, v1)
+
+def indexed_range_mask(columns, indexes, ranges):
+    """
+    Build the combined range filter starting from the most selective range.
+
+    Each range is located in its pre-sorted column with two binary searches.
+    Only the rows inside the narrowest range are checked against the other
+    ranges, so selective filters cost O(log n + candidates) instead of a full
+    scan. Wide selections fall back to range_mask.
+
+    Args:
+        columns (tuple): Release Year, Avg. eBay Sell Price and Sales Volume arrays.
+        indexes (tuple): (order, sorted values) pair for each column, where
+            order sorts the column ascending with NaN last.
+        ranges (tuple): Inclusive (min, max) tuple for each column.
+
+    Returns:
+        ndarray: Boolean mask of the rows inside every range.
+    """
+    ranges = [tuple(_as_column_type(values, bound) for bound in bounds) for values, bounds in zip(columns, ranges)]
+    slices = [
+        (np.searchsorted(sorted_values, low, side="left"), np.searchsorted(sorted_values, high, side="right"))
+        for (_, sorted_values), (low, high) in zip(indexes, ranges)
+    ]
+    best = min(range(len(slices)), key=lambda i: slices[i][1] - slices[i][0])
+    start, stop = slices[best]
+    if stop - start > DENSE_FRACTION * len(columns[0]):
+        return range_mask(*columns, *ranges)
+
+    candidates = indexes[best][0][start:stop]
+    passing = np.ones(len(candidates), dtype=bool)
+    for i, (values, (low, high)) in enumerate(zip(columns, ranges)):
+        if i != best:
+            picked = values[candidates]
+            passing &= (picked >= low) & (picked <= high)
+    keep = np.zeros(len(columns[0]), dtype=bool)
+    keep[candidates[passing]] = True
+    return keep
+
+def first_kept(order, keep, n):
+    """
+    Walk a precomputed ranking and collect the first n rows passing the filter.
+
+    With Numba the walk stops as soon as n rows are found, so wide filters
+    touch only the top of the ranking.
+
+    Args:
+        order (ndarray): Row positions sorted by the ranking column, highest first.
+        keep (ndarray): Boolean filter mask aligned with the rows.
+        n (int): Maximum number of rows to return.
+
+    Returns:
+        ndarray: Up to n row positions, in ranking order.
+    """
+    return _first_kept(order, keep, n)
+
+def count_kept(codes, keep, n_categories):
+    """
+    Count the rows passing the filter per category code.
+
+    With Numba this is a single pass over the codes and the mask, without
+    first copying out the kept codes.
+
+    Args:
+        codes (ndarray): Categorical codes per row, -1 where the category is missing.
+        keep (ndarray): Boolean filter mask aligned with the rows.
+        n_categories (int): Number of categories.
+
+    Returns:
+        ndarray: Count per category code; missing categories are not counted.
+    """
+    return _count_kept(codes, keep, n_categories)
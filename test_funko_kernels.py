@@ -0,0 +1,110 @@
+"""
+Check the filter kernels against the original pandas filter.
+
+Every kernel has a Numba and a numpy implementation, and indexed_range_mask
+switches between a sparse candidate path and a dense full pass, so each
+combination is compared with the Series.between() mask the dashboard used
+before the kernels existed.
+"""
+import importlib.util
+import pathlib
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+KERNELS_PATH = pathlib.Path(__file__).with_name("funko_kernels.py")
+
+def make_columns(n=2000, seed=0):
+    """Build filter columns shaped like load_filter_arrays, with missing values."""
+    rng = np.random.default_rng(seed)
+    years = rng.integers(2010, 2025, n).astype(np.float32)
+    years[rng.random(n) < 0.1] = np.nan
+    prices = np.round(rng.uniform(2, 3300, n), 2).astype(np.float32)
+    prices[rng.random(n) < 0.05] = np.nan
+    volumes = rng.integers(2, 89, n).astype(np.int8)
+    return years, prices, volumes
+
+COLUMNS = make_columns()
+
+def make_selections(count=150, seed=1):
+    """Random slider selections plus full, empty and exact-boundary ranges."""
+    rng = np.random.default_rng(seed)
+    exact_price = round(float(COLUMNS[1][0]), 2)
+    selections = [
+        ((2010, 2024), (2.0, 3300.0), (2, 88)),
+        ((1990, 2000), (2.0, 3300.0), (2, 88)),
+        ((2015, 2015), (exact_price, exact_price), (2, 88)),
+    ]
+    for _ in range(count):
+        y0, y1 = sorted(int(year) for year in rng.integers(2010, 2025, 2))
+        p0, p1 = sorted(round(float(price), 2) for price in rng.uniform(2, 3300, 2))
+        v0, v1 = sorted(int(volume) for volume in rng.integers(2, 89, 2))
+        selections.append(((y0, y1), (p0, p1), (v0, v1)))
+    return selections
+
+SELECTIONS = make_selections()
+
+def baseline_mask(selection):
+    """The dashboard's original Series.between() filter."""
+    mask = np.ones(len(COLUMNS[0]), dtype=bool)
+    for values, (low, high) in zip(COLUMNS, selection):
+        mask &= pd.Series(values).between(low, high, inclusive="both").to_numpy()
+    return mask
+
+def make_indexes(columns):
+    """Sort each column the way load_filter_indexes does."""
+    indexes = []
+    for values in columns:
+        order = np.argsort(values, kind="stable")
+        indexes.append((order, values[order]))
+    return tuple(indexes)
+
+@pytest.fixture(params=["numba", "numpy"])
+def kernels(request, monkeypatch):
+    """funko_kernels compiled with Numba, or a fresh copy using the numpy fallbacks."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        import funko_kernels
+        return funko_kernels
+    # A None entry makes "from numba import njit" raise ImportError
+    monkeypatch.setitem(sys.modules, "numba", None)
+    spec = importlib.util.spec_from_file_location("funko_kernels_numpy", KERNELS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.njit is None
+    return module
+
+def test_range_mask_matches_between(kernels):
+    for selection in SELECTIONS:
+        mask = kernels.range_mask(*COLUMNS, *selection)
+        np.testing.assert_array_equal(mask, baseline_mask(selection), err_msg=str(selection))
+
+@pytest.mark.parametrize("dense_fraction", [0.0, None, 1.0], ids=["dense", "default", "sparse"])
+def test_indexed_range_mask_matches_between(kernels, monkeypatch, dense_fraction):
+    # 0.0 forces every selection through range_mask, 1.0 through the candidate rows
+    if dense_fraction is not None:
+        monkeypatch.setattr(kernels, "DENSE_FRACTION", dense_fraction)
+    indexes = make_indexes(COLUMNS)
+    for selection in SELECTIONS:
+        mask = kernels.indexed_range_mask(COLUMNS, indexes, selection)
+        np.testing.assert_array_equal(mask, baseline_mask(selection), err_msg=str(selection))
+
+def test_first_kept_matches_filtered_ranking(kernels):
+    prices = COLUMNS[1].astype(np.float64)
+    order = np.argsort(-prices, kind="stable")
+    for selection in SELECTIONS[:20]:
+        keep = baseline_mask(selection)
+        for n in (10, len(keep) + 1):
+            expected = order[keep[order]][:n]
+            np.testing.assert_array_equal(kernels.first_kept(order, keep, n), expected)
+
+def test_count_kept_matches_value_counts(kernels):
+    rng = np.random.default_rng(2)
+    categories = pd.Categorical.from_codes(rng.integers(-1, 12, len(COLUMNS[0])), categories=list("ABCDEFGHIJKL"))
+    codes = np.asarray(categories.codes)
+    for selection in SELECTIONS[:20]:
+        keep = baseline_mask(selection)
+        expected = pd.Series(categories)[keep].value_counts(sort=False).to_numpy()
+        np.testing.assert_array_equal(kernels.count_kept(codes, keep, len(categories.categories)), expected)